@@ -21,39 +21,40 @@ def create_results_dataframe(combinations_counter, successful_sims, target_team=
     Returns:
         pd.DataFrame: Sorted results with probabilities
     """
-    results_list = []
-
-    for combination, frequency in combinations_counter.items():
-        pot2_team, pot3_team, pot4_team = combination
-        probability = (frequency / successful_sims) * 100
-
-        results_list.append({
-            'Pot 1': target_team,
-            'Pot 2': pot2_team,
-            'Pot 3': pot3_team,
-            'Pot 4': pot4_team,
-            'Frequency': frequency,
-            'Probability (%)': probability
-        })
-
-    # Create DataFrame
-    df_results = pd.DataFrame(results_list)
-
-    # Sort by probability (descending)
-    df_results = df_results.sort_values('Probability (%)', ascending=False).reset_index(drop=True)
-
-    # Round probabilities
-    df_results['Probability (%)'] = df_results['Probability (%)'].round(PROBABILITY_DECIMALS)
+    combinations = list(combinations_counter)
+    frequencies = np.fromiter(combinations_counter.values(), dtype=np.int64, count=len(combinations))
+
+    # Sort by frequency (descending) once, on the raw arrays
+    order = np.argsort(-frequencies, kind='stable')
+    frequencies = frequencies[order]
+
+    # Unpack (pot2_team, pot3_team, pot4_team) keys into columns
+    pot_columns = [np.array(column, dtype=object)[order] for column in zip(*combinations)]
+    if not pot_columns:
+        pot_columns = [np.array([], dtype=object)] * 3
+
+    # Create DataFrame column-wise
+    df_results = pd.DataFrame({
+        'Pot 1': target_team,
+        'Pot 2': pot_columns[0],
+        'Pot 3': pot_columns[1],
+        'Pot 4': pot_columns[2],
+        'Frequency': frequencies,
+        'Probability (%)': (frequencies / successful_sims * 100).round(PROBABILITY_DECIMALS)
+    })
 
     return df_results
 
 
-def analyze_by_pot(df_results, successful_sims):
+def analyze_by_pot(combinations_counter, successful_sims):
     """
     Analyze most frequent teams by pot.
 
+    Frequencies are summed straight from the combinations counter, one pass
+    per pot position, instead of grouping the full results DataFrame.
+
     Args:
-        df_results: DataFrame with all combinations
+        combinations_counter: Dictionary with combination frequencies
         successful_sims: Number of successful simulations
 
     Returns:
@@ -61,19 +62,25 @@ def analyze_by_pot(df_results, successful_sims):
     """
     analysis_by_pot = {}
 
-    for pot_col in ['Pot 2', 'Pot 3', 'Pot 4']:
+    for position, pot_col in enumerate(['Pot 2', 'Pot 3', 'Pot 4']):
         # Count frequencies by team
-        team_frequencies = df_results.groupby(pot_col)['Frequency'].sum().sort_values(ascending=False)
+        team_counts = Counter()
+        for combination, frequency in combinations_counter.items():
+            team_counts[combination[position]] += frequency
+
+        teams = np.array(list(team_counts), dtype=object)
+        team_frequencies = np.fromiter(team_counts.values(), dtype=np.int64, count=len(team_counts))
 
-        # Calculate probabilities
-        team_probabilities = (team_frequencies / successful_sims * 100).round(PERCENTAGE_DECIMALS)
+        # Sort by frequency (descending)
+        order = np.argsort(-team_frequencies, kind='stable')
+        team_frequencies = team_frequencies[order]
 
-        # Create DataFrame
+        # Create DataFrame with probabilities
         pot_analysis = pd.DataFrame({
-            'Team': team_frequencies.index,
-            'Frequency': team_frequencies.values,
-            'Probability (%)': team_probabilities.values
-        }).reset_index(drop=True)
+            'Team': teams[order],
+            'Frequency': team_frequencies,
+            'Probability (%)': (team_frequencies / successful_sims * 100).round(PERCENTAGE_DECIMALS)
+        })
 
         analysis_by_pot[pot_col] = pot_analysis
 
@@ -92,21 +99,30 @@ def calculate_concentration_metrics(df_results):
     """
     total_combinations = len(df_results)
 
+    # df_results is sorted by probability (descending): one cumulative sum
+    # serves every Top N query and the Gini index
+    probabilities = df_results['Probability (%)'].to_numpy()
+    cumulative_desc = np.cumsum(probabilities)
+
+    def prob_top(top_n):
+        return cumulative_desc[min(top_n, total_combinations) - 1] if total_combinations > 0 else 0
+
     # Top N probabilities
-    prob_top_1 = df_results['Probability (%)'].iloc[0] if len(df_results) > 0 else 0
-    prob_top_10 = df_results.head(10)['Probability (%)'].sum()
-    prob_top_20 = df_results.head(20)['Probability (%)'].sum()
-    prob_top_50 = df_results.head(50)['Probability (%)'].sum()
-    prob_top_100 = df_results.head(100)['Probability (%)'].sum()
+    prob_top_1 = prob_top(1)
+    prob_top_10 = prob_top(10)
+    prob_top_20 = prob_top(20)
+    prob_top_50 = prob_top(50)
+    prob_top_100 = prob_top(100)
 
     # Uniform probability (theoretical)
     uniform_prob = 100 / total_combinations if total_combinations > 0 else 0
 
-    # Gini coefficient (concentration measure)
-    probabilities = df_results['Probability (%)'].sort_values().values
-    n = len(probabilities)
-    if n > 0 and probabilities.sum() > 0:
-        gini_index = (2 * np.sum((np.arange(1, n + 1)) * probabilities)) / (n * np.sum(probabilities)) - (n + 1) / n
+    # Gini coefficient (concentration measure), cumulative-sum form over
+    # probabilities in ascending order: G = (n + 1 - 2 * sum(cumsum) / total) / n
+    n = total_combinations
+    cumulative_asc = np.cumsum(probabilities[::-1])
+    if n > 0 and cumulative_asc[-1] > 0:
+        gini_index = (n + 1 - 2 * cumulative_asc.sum() / cumulative_asc[-1]) / n
     else:
         gini_index = 0
 
@@ -173,23 +189,25 @@ def print_analysis_summary(df_results, analysis_by_pot, concentration_metrics,
 
     for pot_name, pot_analysis in analysis_by_pot.items():
         print(f"\n{pot_name}:")
-        top_10 = pot_analysis.head(TOP_N_TEAMS_PER_POT)
-        for i, row in top_10.iterrows():
-            print(f"   {i + 1:2d}. {row['Team']:40s} {row['Probability (%)']:6.2f}%")
+        top_10 = pot_analysis.head(TOP_N_TEAMS_PER_POT)[['Team', 'Probability (%)']]
+        for i, (team, prob) in enumerate(top_10.itertuples(index=False, name=None), 1):
+            print(f"   {i:2d}. {team:40s} {prob:6.2f}%")
 
     # Top combinations
     print(f"\n\n🏆 3. TOP {min(10, len(df_results))} MOST LIKELY COMBINATIONS FOR {target_team.upper()}")
     print("=" * 70)
 
-    top_combinations = df_results.head(10)
-    for idx, row in top_combinations.iterrows():
-        print(f"\n#{idx + 1}")
+    top_combinations = df_results.head(10)[['Pot 1', 'Pot 2', 'Pot 3', 'Pot 4',
+                                            'Probability (%)', 'Frequency']]
+    rows = top_combinations.itertuples(index=False, name=None)
+    for i, (pot1, pot2, pot3, pot4, prob, frequency) in enumerate(rows, 1):
+        print(f"\n#{i}")
         print(f"   {target_team}'s Group:")
-        print(f"      1. {row['Pot 1']}")
-        print(f"      2. {row['Pot 2']}")
-        print(f"      3. {row['Pot 3']}")
-        print(f"      4. {row['Pot 4']}")
-        print(f"   📊 Probability: {row['Probability (%)']:.4f}%  |  Frequency: {row['Frequency']:,}")
+        print(f"      1. {pot1}")
+        print(f"      2. {pot2}")
+        print(f"      3. {pot3}")
+        print(f"      4. {pot4}")
+        print(f"   📊 Probability: {prob:.4f}%  |  Frequency: {frequency:,}")
 
     print(f"\n{'=' * 70}\n")
 
@@ -238,7 +256,15 @@ def generate_analysis_report(simulation_results, df_pots, target_team=TARGET_TEA
     df_results = create_results_dataframe(combinations_counter, successful_sims, target_team)
 
     # Analyze by pot
-    analysis_by_pot = analyze_by_pot(df_results, successful_sims)
+    analysis_by_pot = analyze_by_pot(combinations_counter, successful_sims)
+
+    # Most frequent team of each pot as (team, probability), extracted once.
+    # (None, 0.0) when there are no successful simulations
+    top_per_pot = {
+        pot_name: (pot_analysis['Team'].iat[0], pot_analysis['Probability (%)'].iat[0])
+        if len(pot_analysis) else (None, 0.0)
+        for pot_name, pot_analysis in analysis_by_pot.items()
+    }
 
     # Calculate concentration metrics
     concentration_metrics = calculate_concentration_metrics(df_results)
@@ -253,6 +279,7 @@ def generate_analysis_report(simulation_results, df_pots, target_team=TARGET_TEA
     return {
         'df_results': df_results,
         'analysis_by_pot': analysis_by_pot,
+        'top_per_pot': top_per_pot,
         'concentration_metrics': concentration_metrics,
         'top_patterns': top_patterns,
         'successful_sims': successful_sims
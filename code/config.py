@@ -15,6 +15,10 @@ TEAMS_PER_POT = 12
 # Group names
 GROUPS = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K', 'L']
 
+# Pot names and the order in which they are drawn
+POTS = ['Pot 1', 'Pot 2', 'Pot 3', 'Pot 4']
+DRAW_ORDER = ['Pot 1', 'Pot 4', 'Pot 3', 'Pot 2']
+
 # ============================================
 # CONFEDERATION RESTRICTIONS
 # ============================================
@@ -39,6 +43,20 @@ FIXED_HOSTS = {
 NUM_SIMULATIONS = 100000
 MAX_ATTEMPTS_PER_SIMULATION = 1000
 
+# Use the Numba-compiled draw engine when numba is installed
+USE_NUMBA = True
+
+# Restart accelerator: before each placement, the first remaining team of the
+# pot (in shuffled order) with at most this many legal groups is drawn next.
+# Fewer draws dead-end and restart, but the sampled distribution no longer
+# matches the official sequential draw exactly. 0 = official order
+CONSTRAINED_TEAM_MAX_GROUPS = 0
+
+# Parallel execution: simulations run in fixed-size chunks, each with its own
+# seed, so results do not depend on the number of workers
+NUM_WORKERS = None  # None = use all CPU cores
+SIMULATIONS_PER_CHUNK = 1000
+
 # Random seed for reproducibility (set to None for true randomness)
 RANDOM_SEED = 42
 
@@ -60,6 +78,28 @@ RESULTS_FILE = f'{OUTPUT_DIR}/resultados_completos.csv'
 ANALYSIS_FILE = f'{OUTPUT_DIR}/analisis_estadistico.csv'
 TOP_COMBINATIONS_FILE = f'{OUTPUT_DIR}/top_100_combinaciones.csv'
 
+# Format of the exported tables: 'parquet' (requires pyarrow), 'csv', or
+# 'dataset' (requires pyarrow): one Hive-partitioned Parquet dataset holding the
+# complete results and the analysis by pot, partitioned by 'category'.
+# Falls back to CSV when pyarrow is not installed; the summary is always CSV
+OUTPUT_FORMAT = 'parquet'
+PARQUET_COMPRESSION = 'snappy'
+PARQUET_ROW_GROUP_SIZE = 100000
+
+# Rows of the complete results converted and written at a time, bounding the
+# memory used by the export
+RESULTS_CHUNK_SIZE = 200000
+
+# Buffer size of exported files, far fewer write syscalls than the 8 KB default
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Timestamp formats: console banners and the run ID in exported file names
+DISPLAY_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+FILE_TIMESTAMP_FORMAT = '%Y%m%d_%H%M%S'
+
+# Threads used to write the export files concurrently
+EXPORT_THREADS = 8
+
 # ============================================
 # ANALYSIS PARAMETERS
 # ============================================
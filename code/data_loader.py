@@ -3,11 +3,32 @@ Data loading and validation module
 Handles loading data from CSV files and validating its structure
 """
 
+import numpy as np
 import pandas as pd
 from collections import defaultdict, Counter
+from dataclasses import dataclass
 from .config import *
 
 
+@dataclass(frozen=True)
+class DrawData:
+    """
+    Validated draw data, as returned by load_and_validate_all().
+
+    Immutable: fields cannot be reassigned once loaded.
+
+    Attributes:
+        df_pots: DataFrame with team-pot mapping
+        df_confederations: DataFrame with team-confederation mapping
+        conf_dict: Dictionary mapping teams to their confederation(s)
+        pot_dict: Dictionary with teams organized by pot
+    """
+    df_pots: pd.DataFrame
+    df_confederations: pd.DataFrame
+    conf_dict: dict
+    pot_dict: dict
+
+
 def load_pots(file_path=POTS_FILE):
     """
     Load teams and their pots from CSV file.
@@ -16,7 +37,8 @@ def load_pots(file_path=POTS_FILE):
         file_path: Path to the pots CSV file
 
     Returns:
-        pd.DataFrame: DataFrame with columns ['Team', 'Pot']
+        pd.DataFrame: DataFrame with categorical columns ['Team', 'Pot'],
+                      'Pot' categories in POTS order
     """
     try:
         df = pd.read_csv(file_path)
@@ -30,6 +52,14 @@ def load_pots(file_path=POTS_FILE):
         df['Team'] = df['Team'].str.strip()
         df['Pot'] = df['Pot'].str.strip()
 
+        unknown_pots = set(df['Pot']) - set(POTS)
+        if unknown_pots:
+            raise ValueError(f"Unknown pots: {sorted(unknown_pots)} (expected {POTS})")
+
+        # Categorical columns: pot codes match the pot index in POTS
+        df['Team'] = df['Team'].astype('category')
+        df['Pot'] = pd.Categorical(df['Pot'], categories=POTS)
+
         print(f"✅ Pots loaded: {len(df)} teams")
         return df
 
@@ -47,7 +77,7 @@ def load_confederations(file_path=CONFEDERATIONS_FILE):
         file_path: Path to the confederations CSV file
 
     Returns:
-        pd.DataFrame: DataFrame with columns ['Team', 'Confederation']
+        pd.DataFrame: DataFrame with categorical columns ['Team', 'Confederation']
     """
     try:
         df = pd.read_csv(file_path)
@@ -61,6 +91,9 @@ def load_confederations(file_path=CONFEDERATIONS_FILE):
         df['Team'] = df['Team'].str.strip()
         df['Confederation'] = df['Confederation'].str.strip()
 
+        df['Team'] = df['Team'].astype('category')
+        df['Confederation'] = df['Confederation'].astype('category')
+
         print(f"✅ Confederations loaded: {len(df)} entries")
         return df
 
@@ -73,20 +106,23 @@ def load_confederations(file_path=CONFEDERATIONS_FILE):
 def create_confederation_dict(df_confederations):
     """
     Create a dictionary mapping each team to its confederation(s).
-    Teams with multiple confederations (playoffs) will have a list.
+    Teams with multiple confederations (playoffs) will have several entries.
+    Tuples are used since the draw looks them up and iterates them constantly.
 
     Args:
         df_confederations: DataFrame with team-confederation mapping
 
     Returns:
-        dict: {team_name: [confederation(s)]}
+        dict: {team_name: (confederation(s),)}
     """
-    conf_dict = {}
-    for team in df_confederations['Team'].unique():
-        confederations = df_confederations[
-            df_confederations['Team'] == team
-            ]['Confederation'].tolist()
-        conf_dict[team] = confederations
+    # One groupby pass instead of a boolean mask per team. Groups keep
+    # first-appearance order, rows keep file order within each group
+    conf_dict = (
+        df_confederations
+        .groupby('Team', observed=True, sort=False)['Confederation']
+        .apply(tuple)
+        .to_dict()
+    )
 
     return conf_dict
 
@@ -101,14 +137,85 @@ def create_pot_dict(df_pots):
     Returns:
         dict: {pot_name: [team1, team2, ...]}
     """
-    pot_dict = {}
-    for pot in df_pots['Pot'].unique():
-        teams = df_pots[df_pots['Pot'] == pot]['Team'].tolist()
-        pot_dict[pot] = teams
+    # One groupby pass instead of a boolean mask per pot
+    pot_dict = (
+        df_pots
+        .groupby('Pot', observed=True, sort=False)['Team']
+        .apply(list)
+        .to_dict()
+    )
 
     return pot_dict
 
 
+def encode_draw_data(pot_dict, conf_dict):
+    """
+    Encode teams, pots and confederations as small integers for the compiled
+    draw engine.
+
+    Team IDs follow pot order (Pot 1 first), confederation 0 is always UEFA.
+
+    Args:
+        pot_dict: Dictionary with teams organized by pot
+        conf_dict: Dictionary mapping teams to their confederation(s)
+
+    Returns:
+        dict: {
+            'team_names': list mapping team ID to team name,
+            'team_ids': {team_name: team ID},
+            'team_pot': int8 array with the pot index of each team,
+            'team_confs': int8 array [team, conf slot], padded with -1,
+            'conf_names': list mapping confederation ID to name,
+            'conf_limits': int8 array with the max teams per group by confederation,
+            'pot_teams_flat': int16 array with the teams of every pot, concatenated,
+            'pot_offsets': int64 array delimiting each pot in pot_teams_flat,
+            'draw_order': int64 array with pot indices in draw order,
+            'fixed_host_ids': int16 array with the fixed host team IDs,
+            'fixed_host_groups': int64 array with the group index of each host
+        }
+    """
+    team_names = [team for pot in POTS for team in pot_dict[pot]]
+    team_ids = {team: team_id for team_id, team in enumerate(team_names)}
+
+    other_confs = sorted({conf for team in team_names for conf in conf_dict[team]} - {'UEFA'})
+    conf_names = ['UEFA'] + other_confs
+    conf_ids = {conf: conf_id for conf_id, conf in enumerate(conf_names)}
+    conf_limits = np.array(
+        [MAX_UEFA_PER_GROUP] + [MAX_OTHER_CONF_PER_GROUP] * len(other_confs),
+        dtype=np.int8
+    )
+
+    max_confs = max(len(conf_dict[team]) for team in team_names)
+    team_confs = np.full((len(team_names), max_confs), -1, dtype=np.int8)
+    team_pot = np.empty(len(team_names), dtype=np.int8)
+
+    for team, team_id in team_ids.items():
+        for slot, conf in enumerate(conf_dict[team]):
+            team_confs[team_id, slot] = conf_ids[conf]
+
+    pot_offsets = np.zeros(len(POTS) + 1, dtype=np.int64)
+    for pot_idx, pot in enumerate(POTS):
+        pot_offsets[pot_idx + 1] = pot_offsets[pot_idx] + len(pot_dict[pot])
+        team_pot[pot_offsets[pot_idx]:pot_offsets[pot_idx + 1]] = pot_idx
+
+    # Only hosts drawn from Pot 1 have a fixed group
+    fixed_hosts = [(host, group) for host, group in FIXED_HOSTS.items() if host in pot_dict['Pot 1']]
+
+    return {
+        'team_names': team_names,
+        'team_ids': team_ids,
+        'team_pot': team_pot,
+        'team_confs': team_confs,
+        'conf_names': conf_names,
+        'conf_limits': conf_limits,
+        'pot_teams_flat': np.arange(len(team_names), dtype=np.int16),
+        'pot_offsets': pot_offsets,
+        'draw_order': np.array([POTS.index(pot) for pot in DRAW_ORDER], dtype=np.int64),
+        'fixed_host_ids': np.array([team_ids[host] for host, _ in fixed_hosts], dtype=np.int16),
+        'fixed_host_groups': np.array([GROUPS.index(group) for _, group in fixed_hosts], dtype=np.int64)
+    }
+
+
 def validate_data(df_pots, df_confederations):
     """
     Validate the loaded data for consistency and completeness.
@@ -202,7 +309,7 @@ def load_and_validate_all():
     Load and validate all required data files.
 
     Returns:
-        tuple: (df_pots, df_confederations, conf_dict, pot_dict)
+        DrawData: DataFrames and dictionaries describing the draw
     """
     print("📊 Loading data from CSV files...\n")
 
@@ -221,4 +328,4 @@ def load_and_validate_all():
     # Validate
     validate_data(df_pots, df_confederations)
 
-    return df_pots, df_confederations, conf_dict, pot_dict
\ No newline at end of file
+    return DrawData(df_pots, df_confederations, conf_dict, pot_dict)
\ No newline at end of file
@@ -3,83 +3,153 @@ Draw simulation module
 Contains the core logic for simulating FIFA World Cup 2026 draws
 """
 
-import random
-from collections import defaultdict
+import os
+import numpy as np
+from collections import defaultdict, Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from .config import *
+from .data_loader import encode_draw_data
+# Hot confederation checks, compiled when a mypyc build of the module exists
+from .simulator_core import GROUP_BITS, get_available_groups_for_team
+# Unused here, re-exported since it was defined in this module before the move
+from .simulator_core import can_team_go_to_group  # noqa: F401
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
 
-def can_team_go_to_group(team, group, groups_formed, conf_dict):
+    def njit(*args, **kwargs):
+        """Fallback decorator used when numba is not installed."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+# Slot of each (group, pot) pair in the flat group_slots list: group offset + pot offset
+GROUP_SLOT_OFFSETS = {group: idx * NUM_POTS for idx, group in enumerate(GROUPS)}
+POT_SLOT_OFFSETS = {pot: idx for idx, pot in enumerate(POTS)}
+
+# Default generator for the Python engine, worker chunks use their own
+rng = np.random.default_rng(RANDOM_SEED)
+
+
+def assign_team_to_group(team, group, pot_name, group_slots, groups_filled_by_pot,
+                         conf_counts_by_group, conf_dict):
     """
-    Check if a team can be assigned to a group based on confederation restrictions.
+    Place a team in a group and update the draw state.
 
     Args:
         team: Team name
         group: Group letter ('A', 'B', etc.)
-        groups_formed: Dictionary with current group formations
-        conf_dict: Dictionary mapping teams to their confederation(s)
+        pot_name: Pot name ('Pot 1', 'Pot 2', etc.)
+        group_slots: Flat list with one slot per (group, pot), group-major
+        groups_filled_by_pot: Dictionary with a bitmask of the filled groups for each pot
+        conf_counts_by_group: Dictionary with a confederation Counter per group
+        conf_dict: Dictionary mapping teams to confederations
+    """
+    group_slots[GROUP_SLOT_OFFSETS[group] + POT_SLOT_OFFSETS[pot_name]] = team
+    groups_filled_by_pot[pot_name] |= GROUP_BITS[group]
+    conf_counts_by_group[group].update(conf_dict[team])
+
+
+def pick_random_group(available_mask, u):
+    """
+    Pick a group uniformly at random from a bitmask of available groups.
+
+    Args:
+        available_mask: Bitmask of available groups (non-zero)
+        u: Uniform random number in [0, 1)
 
     Returns:
-        bool: True if team can go to the group, False otherwise
+        str: Group letter
     """
-    # Get team's confederation(s) (can be a list for playoff teams)
-    team_confederations = conf_dict.get(team, [])
-
-    if not team_confederations:
-        return True  # If not in dict, allow (shouldn't happen)
-
-    # Get teams already in the group
-    teams_in_group = groups_formed.get(group, [])
-
-    # Count confederations currently in the group
-    conf_counter = defaultdict(int)
-    for existing_team in teams_in_group:
-        existing_confs = conf_dict.get(existing_team, [])
-        for conf in existing_confs:
-            conf_counter[conf] += 1
-
-    # Check each confederation of the team
-    for conf in team_confederations:
-        if conf == 'UEFA':
-            # UEFA can have maximum 2 teams per group
-            if conf_counter[conf] >= MAX_UEFA_PER_GROUP:
-                return False
-        else:
-            # Other confederations: maximum 1 team per group
-            if conf_counter[conf] >= MAX_OTHER_CONF_PER_GROUP:
-                return False
+    bits = available_mask
+    for _ in range(int(u * bin(available_mask).count('1'))):
+        bits &= bits - 1  # Clear the lowest set bit
 
-    return True
+    return GROUPS[(bits & -bits).bit_length() - 1]
 
 
-def get_available_groups_for_team(team, pot_name, groups_formed, groups_filled_by_pot, conf_dict):
+def split_fixed_hosts(pot_dict):
     """
-    Get list of groups where a team can be assigned.
+    Split Pot 1 into fixed hosts and teams that are drawn.
 
     Args:
-        team: Team name
+        pot_dict: Dictionary with teams organized by pot
+
+    Returns:
+        tuple: (pot1_non_hosts, fixed_host_assignments) where
+               fixed_host_assignments is a list of (host, group)
+    """
+    pot1_non_hosts = [team for team in pot_dict['Pot 1'] if team not in FIXED_HOSTS]
+    fixed_host_assignments = [
+        (host, group) for host, group in FIXED_HOSTS.items() if host in pot_dict['Pot 1']
+    ]
+
+    return pot1_non_hosts, fixed_host_assignments
+
+
+def create_order_buffers(pot_dict, pot1_split):
+    """
+    Allocate the index lists shuffled in place to get each pot's draw order.
+    Any starting arrangement shuffles to a uniform order, so the buffers are
+    reused across draws without resetting. Plain lists are read directly by
+    the draw loop, with no per-attempt conversion from a numpy array.
+
+    Args:
+        pot_dict: Dictionary with teams organized by pot
+        pot1_split: Result of split_fixed_hosts(pot_dict)
+
+    Returns:
+        dict: {pot_name: list of team indices}
+    """
+    order_buffers = {pot: list(range(len(teams))) for pot, teams in pot_dict.items()}
+    order_buffers['Pot 1'] = list(range(len(pot1_split[0])))
+
+    return order_buffers
+
+
+def next_team_to_draw(order, pot_teams, pot_name, conf_counts_by_group, groups_filled_by_pot,
+                      conf_dict, max_groups):
+    """
+    Remove and return the next team to draw from a pot's remaining order
+    when constrained teams are prioritized: the first team with at most
+    max_groups available groups, or the first team if there is none.
+
+    Args:
+        order: List of remaining team indices in shuffled order (modified in place)
+        pot_teams: List of teams in the pot
         pot_name: Pot name ('Pot 1', 'Pot 2', etc.)
-        groups_formed: Dictionary with current group formations
-        groups_filled_by_pot: Dictionary tracking which groups are filled for each pot
+        conf_counts_by_group: Dictionary with a confederation Counter per group
+        groups_filled_by_pot: Dictionary with a bitmask of the filled groups for each pot
         conf_dict: Dictionary mapping teams to confederations
+        max_groups: Constrained-team threshold
 
     Returns:
-        list: Available group letters
+        tuple: (team, available_mask)
     """
-    available_groups = []
+    first_available = None
 
-    for group in GROUPS:
-        # Skip if group already has a team from this pot
-        if group in groups_filled_by_pot.get(pot_name, set()):
-            continue
+    for position, idx in enumerate(order):
+        available = get_available_groups_for_team(
+            pot_teams[idx], pot_name, conf_counts_by_group, groups_filled_by_pot, conf_dict
+        )
 
-        # Check confederation restrictions
-        if can_team_go_to_group(team, group, groups_formed, conf_dict):
-            available_groups.append(group)
+        if position == 0:
+            first_available = available
 
-    return available_groups
+        if bin(available).count('1') <= max_groups:
+            del order[position]
+            return pot_teams[idx], available
 
+    return pot_teams[order.pop(0)], first_available
 
-def simulate_single_draw(df_pots, conf_dict, pot_dict, max_attempts=MAX_ATTEMPTS_PER_SIMULATION):
+
+def simulate_single_draw(df_pots, conf_dict, pot_dict, max_attempts=MAX_ATTEMPTS_PER_SIMULATION,
+                         target_team=TARGET_TEAM, rng=rng, pot1_split=None, order_buffers=None):
     """
     Simulate a single complete draw.
 
@@ -88,50 +158,102 @@ def simulate_single_draw(df_pots, conf_dict, pot_dict, max_attempts=MAX_ATTEMPTS
         conf_dict: Dictionary with team confederations
         pot_dict: Dictionary with teams organized by pot
         max_attempts: Maximum attempts before restarting
+        target_team: Team whose group is tracked during the draw
+        rng: numpy.random.Generator used for shuffling and group picks
+        pot1_split: Result of split_fixed_hosts(pot_dict), computed if None
+        order_buffers: Result of create_order_buffers(), allocated if None
 
     Returns:
-        dict: Groups formed {group: [team1, team2, team3, team4]}, or None if failed
+        tuple: (groups_formed, target_group_teams) where groups_formed is
+               {group: [pot1_team, pot2_team, pot3_team, pot4_team]},
+               or (None, None) if failed
     """
+    if pot1_split is None:
+        pot1_split = split_fixed_hosts(pot_dict)
+    pot1_teams, fixed_host_assignments = pot1_split
+
+    if order_buffers is None:
+        order_buffers = create_order_buffers(pot_dict, pot1_split)
+
+    # Groups as one flat list, allocated once per draw. A complete draw writes
+    # every slot, so leftovers from failed attempts never need clearing
+    group_slots = [None] * (NUM_GROUPS * NUM_POTS)
+
+    # Bind hot functions and constants to locals: local lookups are cheaper
+    # than global and attribute lookups in the loops below
+    _shuffle = rng.shuffle
+    _uniform_batch = rng.random
+    _get_available = get_available_groups_for_team
+    _pick_group = pick_random_group
+    _assign = assign_team_to_group
+    _groups = GROUPS
+    _pots = POTS
+    _num_picks = NUM_GROUPS * NUM_POTS
+    _max_groups = CONSTRAINED_TEAM_MAX_GROUPS
+
     for attempt in range(max_attempts):
         # Initialize empty groups
-        groups_formed = {group: [] for group in GROUPS}
-
-        # Track which groups are filled for each pot
-        groups_filled_by_pot = {
-            'Pot 1': set(),
-            'Pot 2': set(),
-            'Pot 3': set(),
-            'Pot 4': set()
-        }
+        conf_counts_by_group = {group: Counter() for group in _groups}
+        target_group = None
+
+        # Track which groups are filled for each pot (bitmask over GROUPS)
+        groups_filled_by_pot = {pot: 0 for pot in _pots}
+
+        # One batch of uniforms per attempt, consumed by the group picks
+        uniforms = iter(_uniform_batch(_num_picks).tolist())
 
         # ============================================
         # PHASE 1: Draw Pot 1 (Seeded teams)
         # ============================================
 
         # First, assign fixed hosts
-        pot1_teams = pot_dict['Pot 1'].copy()
-
-        for host, fixed_group in FIXED_HOSTS.items():
-            if host in pot1_teams:
-                groups_formed[fixed_group].append(host)
-                groups_filled_by_pot['Pot 1'].add(fixed_group)
-                pot1_teams.remove(host)
-
-        # Shuffle remaining Pot 1 teams
-        random.shuffle(pot1_teams)
-
-        # Assign remaining Pot 1 teams
-        for team in pot1_teams:
-            available = get_available_groups_for_team(
-                team, 'Pot 1', groups_formed, groups_filled_by_pot, conf_dict
-            )
+        for host, fixed_group in fixed_host_assignments:
+            _assign(host, fixed_group, 'Pot 1', group_slots, groups_filled_by_pot,
+                    conf_counts_by_group, conf_dict)
+
+            if host == target_team:
+                target_group = fixed_group
+
+        # Assign remaining Pot 1 teams in random order
+        pot1_order = order_buffers['Pot 1']
+        _shuffle(pot1_order)
+
+        # Plain draws walk the shuffled buffer from the end without copying it;
+        # constrained draws remove teams out of order, so they work on a copy
+        remaining = pot1_order[:] if _max_groups > 0 else None
+        position = len(pot1_order)
+
+        # Groups each confederation signature may join in this pot pass. An
+        # assignment only changes the counts of the group it fills, which is
+        # masked out for the rest of the pot, so entries never go stale
+        legal_by_confs = {}
+
+        while position:
+            position -= 1
+            if remaining is not None:
+                team, available = next_team_to_draw(
+                    remaining, pot1_teams, 'Pot 1', conf_counts_by_group, groups_filled_by_pot,
+                    conf_dict, _max_groups
+                )
+            else:
+                team = pot1_teams[pot1_order[position]]
+                confs = conf_dict[team]
+                legal = legal_by_confs.get(confs)
+                if legal is None:
+                    legal = legal_by_confs[confs] = _get_available(
+                        team, 'Pot 1', conf_counts_by_group, groups_filled_by_pot, conf_dict
+                    )
+                available = legal & ~groups_filled_by_pot['Pot 1']
 
             if not available:
                 break  # Restart draw
 
-            assigned_group = random.choice(available)
-            groups_formed[assigned_group].append(team)
-            groups_filled_by_pot['Pot 1'].add(assigned_group)
+            assigned_group = _pick_group(available, next(uniforms))
+            _assign(team, assigned_group, 'Pot 1', group_slots, groups_filled_by_pot,
+                    conf_counts_by_group, conf_dict)
+
+            if team == target_team:
+                target_group = assigned_group
         else:
             # Pot 1 completed successfully, continue with other pots
             draw_successful = True
@@ -141,49 +263,300 @@ def simulate_single_draw(df_pots, conf_dict, pot_dict, max_attempts=MAX_ATTEMPTS
             # ============================================
 
             for pot_name in ['Pot 4', 'Pot 3', 'Pot 2']:
-                pot_teams = pot_dict[pot_name].copy()
-                random.shuffle(pot_teams)
-
-                for team in pot_teams:
-                    available = get_available_groups_for_team(
-                        team, pot_name, groups_formed, groups_filled_by_pot, conf_dict
-                    )
+                pot_teams = pot_dict[pot_name]
+                pot_order = order_buffers[pot_name]
+                _shuffle(pot_order)
+                remaining = pot_order[:] if _max_groups > 0 else None
+                position = len(pot_order)
+                legal_by_confs = {}
+
+                while position:
+                    position -= 1
+                    if remaining is not None:
+                        team, available = next_team_to_draw(
+                            remaining, pot_teams, pot_name, conf_counts_by_group,
+                            groups_filled_by_pot, conf_dict, _max_groups
+                        )
+                    else:
+                        team = pot_teams[pot_order[position]]
+                        confs = conf_dict[team]
+                        legal = legal_by_confs.get(confs)
+                        if legal is None:
+                            legal = legal_by_confs[confs] = _get_available(
+                                team, pot_name, conf_counts_by_group, groups_filled_by_pot,
+                                conf_dict
+                            )
+                        available = legal & ~groups_filled_by_pot[pot_name]
 
                     if not available:
                         draw_successful = False
                         break  # Restart entire draw
 
-                    assigned_group = random.choice(available)
-                    groups_formed[assigned_group].append(team)
-                    groups_filled_by_pot[pot_name].add(assigned_group)
+                    assigned_group = _pick_group(available, next(uniforms))
+                    _assign(team, assigned_group, pot_name, group_slots,
+                            groups_filled_by_pot, conf_counts_by_group, conf_dict)
+
+                    if team == target_team:
+                        target_group = assigned_group
 
                 if not draw_successful:
                     break  # Restart entire draw
 
             # If all pots completed successfully, return result
             if draw_successful:
-                return groups_formed
+                groups_formed = {
+                    group: group_slots[offset:offset + NUM_POTS]
+                    for group, offset in GROUP_SLOT_OFFSETS.items()
+                }
+                return groups_formed, groups_formed[target_group]
 
     # If reached here, couldn't complete draw in max_attempts
-    return None
+    return None, None
 
 
-def run_mass_simulation(df_pots, conf_dict, pot_dict, num_simulations=NUM_SIMULATIONS,
-                        target_team=TARGET_TEAM, show_progress=True):
+@njit(cache=True)
+def simulate_single_draw_nb(pot_teams_flat, pot_offsets, team_confs, conf_limits, draw_order,
+                            fixed_host_ids, fixed_host_groups, max_attempts, target_id,
+                            constrained_max_groups, groups, pot_filled, conf_counts, available,
+                            pot_teams):
     """
-    Run multiple draw simulations and collect statistics.
+    Compiled version of simulate_single_draw working on integer-encoded data.
+    All working arrays are scratch buffers owned by the caller and reset here,
+    so no memory is allocated per draw.
+
+    Args:
+        pot_teams_flat: Team IDs of every pot, concatenated
+        pot_offsets: Start/end of each pot in pot_teams_flat
+        team_confs: Confederation IDs of each team, padded with -1
+        conf_limits: Max teams per group for each confederation ID
+        draw_order: Pot indices in draw order
+        fixed_host_ids: Team IDs of the fixed hosts
+        fixed_host_groups: Group index of each fixed host
+        max_attempts: Maximum attempts before giving up
+        target_id: Team ID whose group is tracked during the draw
+        constrained_max_groups: Draw the first remaining team with at most this
+                                many available groups next (0 = official order)
+        groups: int16 buffer [group, pot], filled with the drawn team IDs
+        pot_filled: bool buffer [pot, group]
+        conf_counts: int8 buffer [group, confederation]
+        available: int64 buffer with one slot per group
+        pot_teams: int16 buffer with one slot per team
+
+    Returns:
+        tuple: (groups, success, target_group) where groups[group, pot] holds team IDs
+    """
+    num_groups = groups.shape[0]
+
+    for attempt in range(max_attempts):
+        groups[:] = -1
+        pot_filled[:] = False
+        conf_counts[:] = 0
+        target_group = -1
+        draw_successful = True
+
+        for order_idx in range(draw_order.shape[0]):
+            pot = draw_order[order_idx]
+            num_teams = 0
+
+            # Fixed hosts go straight to their group, the rest is shuffled
+            for k in range(pot_offsets[pot], pot_offsets[pot + 1]):
+                team = pot_teams_flat[k]
+                host_group = -1
+                for h in range(fixed_host_ids.shape[0]):
+                    if fixed_host_ids[h] == team:
+                        host_group = fixed_host_groups[h]
+
+                if host_group >= 0:
+                    if team == target_id:
+                        target_group = host_group
+                    groups[host_group, pot] = team
+                    pot_filled[pot, host_group] = True
+                    for c in team_confs[team]:
+                        if c >= 0:
+                            conf_counts[host_group, c] += 1
+                else:
+                    pot_teams[num_teams] = team
+                    num_teams += 1
+
+            # Fisher-Yates shuffle
+            for i in range(num_teams - 1, 0, -1):
+                j = np.random.randint(0, i + 1)
+                pot_teams[i], pot_teams[j] = pot_teams[j], pot_teams[i]
+
+            for i in range(num_teams):
+                # Optionally bring the first constrained team forward, keeping
+                # the shuffled order of the others
+                if constrained_max_groups > 0:
+                    for k in range(i, num_teams):
+                        num_available = 0
+                        for group in range(num_groups):
+                            if pot_filled[pot, group]:
+                                continue
+                            allowed = True
+                            for c in team_confs[pot_teams[k]]:
+                                if c >= 0 and conf_counts[group, c] >= conf_limits[c]:
+                                    allowed = False
+                                    break
+                            if allowed:
+                                num_available += 1
+
+                        if num_available <= constrained_max_groups:
+                            team = pot_teams[k]
+                            for m in range(k, i, -1):
+                                pot_teams[m] = pot_teams[m - 1]
+                            pot_teams[i] = team
+                            break
+
+                team = pot_teams[i]
+                num_available = 0
+
+                for group in range(num_groups):
+                    if pot_filled[pot, group]:
+                        continue
+
+                    allowed = True
+                    for c in team_confs[team]:
+                        if c >= 0 and conf_counts[group, c] >= conf_limits[c]:
+                            allowed = False
+                            break
+
+                    if allowed:
+                        available[num_available] = group
+                        num_available += 1
+
+                if num_available == 0:
+                    draw_successful = False
+                    break  # Restart entire draw
+
+                group = available[np.random.randint(0, num_available)]
+                if team == target_id:
+                    target_group = group
+                groups[group, pot] = team
+                pot_filled[pot, group] = True
+                for c in team_confs[team]:
+                    if c >= 0:
+                        conf_counts[group, c] += 1
+
+            if not draw_successful:
+                break  # Restart entire draw
+
+        if draw_successful:
+            return groups, True, target_group
+
+    return groups, False, -1
+
+
+@njit(parallel=True, cache=True)
+def run_simulations_nb(num_simulations, chunk_size, base_seed, pot_teams_flat, pot_offsets,
+                       team_confs, conf_limits, draw_order, fixed_host_ids, fixed_host_groups,
+                       num_groups, max_attempts, target_id, constrained_max_groups):
+    """
+    Run many compiled draws in parallel, one chunk of simulations per task.
+    Each chunk reseeds the generator with base_seed + chunk index, so results
+    do not depend on the number of threads.
+
+    Args:
+        num_simulations: Number of simulations to run
+        chunk_size: Number of simulations per chunk
+        base_seed: Seed of the first chunk
+        (remaining arguments as in simulate_single_draw_nb)
+
+    Returns:
+        tuple: (target_rows, successes) where target_rows[sim, pot] holds the
+               team IDs of the target team's group in each simulation
+    """
+    num_pots = pot_offsets.shape[0] - 1
+    num_chunks = (num_simulations + chunk_size - 1) // chunk_size
+    target_rows = np.full((num_simulations, num_pots), -1, dtype=np.int16)
+    successes = np.zeros(num_simulations, dtype=np.bool_)
+
+    for chunk in prange(num_chunks):
+        np.random.seed(base_seed + chunk)
+
+        # Scratch buffers, allocated once per chunk and reused by every draw
+        groups = np.empty((num_groups, num_pots), dtype=np.int16)
+        pot_filled = np.empty((num_pots, num_groups), dtype=np.bool_)
+        conf_counts = np.empty((num_groups, conf_limits.shape[0]), dtype=np.int8)
+        available = np.empty(num_groups, dtype=np.int64)
+        pot_teams = np.empty(pot_teams_flat.shape[0], dtype=np.int16)
+
+        for sim in range(chunk * chunk_size, min((chunk + 1) * chunk_size, num_simulations)):
+            groups, success, target_group = simulate_single_draw_nb(
+                pot_teams_flat, pot_offsets, team_confs, conf_limits, draw_order,
+                fixed_host_ids, fixed_host_groups, max_attempts, target_id,
+                constrained_max_groups, groups, pot_filled, conf_counts, available, pot_teams
+            )
+
+            if success:
+                successes[sim] = True
+                target_rows[sim] = groups[target_group]
+
+    return target_rows, successes
+
+
+def run_simulation_chunk(num_simulations, seed, df_pots, conf_dict, pot_dict, target_team):
+    """
+    Run a chunk of draw simulations with the Python engine.
+    Module-level so it can be sent to worker processes.
 
     Args:
+        num_simulations: Number of simulations in the chunk
+        seed: Seed for the chunk's random generator
         df_pots: DataFrame with team-pot mapping
         conf_dict: Dictionary with team confederations
         pot_dict: Dictionary with teams organized by pot
+        target_team: Team to focus analysis on
+
+    Returns:
+        tuple: (combinations, successful, failed) where combinations is a
+               plain dict of combination frequencies
+    """
+    chunk_rng = np.random.default_rng(seed)
+    pot1_split = split_fixed_hosts(pot_dict)
+    order_buffers = create_order_buffers(pot_dict, pot1_split)
+
+    combinations_counter = defaultdict(int)
+    successful_sims = 0
+    failed_sims = 0
+
+    for _ in range(num_simulations):
+        result, target_group_teams = simulate_single_draw(df_pots, conf_dict, pot_dict,
+                                                          target_team=target_team, rng=chunk_rng,
+                                                          pot1_split=pot1_split,
+                                                          order_buffers=order_buffers)
+
+        if result:
+            successful_sims += 1
+
+            # Teams come in pot order: drop Pot 1 since it's always the target team
+            combination = tuple(target_group_teams[1:])
+            combinations_counter[combination] += 1
+        else:
+            failed_sims += 1
+
+    return dict(combinations_counter), successful_sims, failed_sims
+
+
+def run_mass_simulation(draw_data, num_simulations=NUM_SIMULATIONS, target_team=TARGET_TEAM,
+                        show_progress=True, num_workers=NUM_WORKERS, rng=rng):
+    """
+    Run multiple draw simulations and collect statistics.
+
+    Simulations are split into chunks of SIMULATIONS_PER_CHUNK, each seeded
+    from rng, and run in parallel: compiled chunks on Numba threads, Python
+    chunks on worker processes.
+
+    Args:
+        draw_data: DrawData returned by load_and_validate_all()
         num_simulations: Number of simulations to run
         target_team: Team to focus analysis on (default: Argentina)
         show_progress: Whether to show progress updates
+        num_workers: Number of worker processes for the Python engine (None = all cores)
+        rng: numpy.random.Generator the chunk seeds are drawn from
 
     Returns:
         dict: {
-            'combinations': defaultdict with combination frequencies,
+            'combinations': Counter with combination frequencies,
             'successful': number of successful simulations,
             'failed': number of failed simulations
         }
@@ -191,6 +564,14 @@ def run_mass_simulation(df_pots, conf_dict, pot_dict, num_simulations=NUM_SIMULA
     import time
     from datetime import datetime
 
+    df_pots, conf_dict, pot_dict = draw_data.df_pots, draw_data.conf_dict, draw_data.pot_dict
+
+    use_numba = USE_NUMBA and NUMBA_AVAILABLE
+    num_workers = num_workers or os.cpu_count() or 1
+
+    # Chunk seeds derive from rng (seeded with RANDOM_SEED in run_simulator.py)
+    base_seed = int(rng.integers(2 ** 31 - 1))
+
     if show_progress:
         print("🚀 MASS SIMULATION - FIFA WORLD CUP 2026 DRAW")
         print("=" * 70)
@@ -199,63 +580,87 @@ def run_mass_simulation(df_pots, conf_dict, pot_dict, num_simulations=NUM_SIMULA
         print(f"\n⚙️ Configuration:")
         print(f"   • Number of simulations: {num_simulations:,}")
         print(f"   • Target team: {target_team}")
+        print(f"   • Engine: {'Numba JIT' if use_numba else 'Python'}")
+        if not use_numba:
+            print(f"   • Worker processes: {num_workers}")
         print(f"\n🎲 Running simulations...\n")
 
-    # Dictionary to count combinations for target team
+    # Counter of combinations for target team
     # Key: (pot2_team, pot3_team, pot4_team)
     # Value: frequency count
-    combinations_counter = defaultdict(int)
+    combinations_counter = Counter()
 
     successful_sims = 0
     failed_sims = 0
 
     start_time = time.time()
 
-    for i in range(1, num_simulations + 1):
-        # Show progress
-        if show_progress and i % SHOW_PROGRESS_EVERY == 0:
-            elapsed = time.time() - start_time
-            speed = i / elapsed
-            remaining = (num_simulations - i) / speed
-
-            print(f"   Progress: {i:,}/{num_simulations:,} ({i / num_simulations * 100:.1f}%) | "
-                  f"Speed: {speed:.0f} sim/sec | "
-                  f"Time remaining: {remaining:.0f}s")
-
-        # Run one simulation
-        result = simulate_single_draw(df_pots, conf_dict, pot_dict)
-
-        if result:
-            successful_sims += 1
-
-            # Find target team's group
-            for group, teams in result.items():
-                if target_team in teams:
-                    # Identify teams from each pot
-                    pot1_team = None
-                    pot2_team = None
-                    pot3_team = None
-                    pot4_team = None
-
-                    for team in teams:
-                        pot = df_pots[df_pots['Team'] == team]['Pot'].values[0]
-
-                        if pot == 'Pot 1':
-                            pot1_team = team
-                        elif pot == 'Pot 2':
-                            pot2_team = team
-                        elif pot == 'Pot 3':
-                            pot3_team = team
-                        elif pot == 'Pot 4':
-                            pot4_team = team
-
-                    # Create combination key (excluding Pot 1 since it's always the target team)
-                    combination = (pot2_team, pot3_team, pot4_team)
-                    combinations_counter[combination] += 1
-
-                    break
+    if use_numba:
+        encoded = encode_draw_data(pot_dict, conf_dict)
+        team_names = encoded['team_names']
+
+        target_rows, successes = run_simulations_nb(
+            num_simulations, SIMULATIONS_PER_CHUNK, base_seed,
+            encoded['pot_teams_flat'], encoded['pot_offsets'], encoded['team_confs'],
+            encoded['conf_limits'], encoded['draw_order'], encoded['fixed_host_ids'],
+            encoded['fixed_host_groups'], NUM_GROUPS, MAX_ATTEMPTS_PER_SIMULATION,
+            encoded['team_ids'][target_team], CONSTRAINED_TEAM_MAX_GROUPS
+        )
+
+        successful_sims = int(successes.sum())
+        failed_sims = num_simulations - successful_sims
+
+        # Columns are pots (Pot 1 first), so drop the target team's column
+        if successful_sims > 0:
+            rows, counts = np.unique(target_rows[successes], axis=0, return_counts=True)
+            for row, count in zip(rows, counts):
+                combination = tuple(team_names[team_id] for team_id in row[1:])
+                combinations_counter[combination] = int(count)
+    else:
+        chunks = [
+            (chunk, min(SIMULATIONS_PER_CHUNK, num_simulations - start))
+            for chunk, start in enumerate(range(0, num_simulations, SIMULATIONS_PER_CHUNK))
+        ]
+        chunk_args = (df_pots, conf_dict, pot_dict, target_team)
+
+        if num_workers > 1:
+            executor = ProcessPoolExecutor(max_workers=num_workers)
+            futures = [
+                executor.submit(run_simulation_chunk, size, base_seed + chunk, *chunk_args)
+                for chunk, size in chunks
+            ]
+            chunk_results = (future.result() for future in as_completed(futures))
         else:
-            failed_sims += 1
+            executor = None
+            chunk_results = (
+                run_simulation_chunk(size, base_seed + chunk, *chunk_args)
+                for chunk, size in chunks
+            )
+
+        try:
+            for chunk_counter, chunk_successful, chunk_failed in chunk_results:
+                done_before = successful_sims + failed_sims
+                successful_sims += chunk_successful
+                failed_sims += chunk_failed
+
+                # Counter.update adds counts (it does not overwrite like dict.update)
+                combinations_counter.update(chunk_counter)
+
+                # Show progress
+                done = successful_sims + failed_sims
+                if show_progress and done // SHOW_PROGRESS_EVERY > done_before // SHOW_PROGRESS_EVERY:
+                    elapsed = time.time() - start_time
+                    speed = done / elapsed
+                    remaining = (num_simulations - done) / speed
+
+                    print(f"   Progress: {done:,}/{num_simulations:,} ({done / num_simulations * 100:.1f}%) | "
+                          f"Speed: {speed:.0f} sim/sec | "
+                          f"Time remaining: {remaining:.0f}s")
+        finally:
+            if executor is not None:
+                for future in futures:
+                    future.cancel()
+                executor.shutdown()
 
     total_time = time.time() - start_time
 
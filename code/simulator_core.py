@@ -0,0 +1,78 @@
+"""
+Draw simulation core
+Hot confederation checks of the Python draw engine, fully type-annotated so
+the module can be compiled with mypyc (see README). The plain Python module
+is used when no compiled version is present.
+"""
+
+from typing import Dict, Tuple
+from .config import GROUPS, MAX_UEFA_PER_GROUP, MAX_OTHER_CONF_PER_GROUP
+
+
+# Bit of each group in the 12-bit group masks used by the Python engine
+GROUP_BITS: Dict[str, int] = {group: 1 << idx for idx, group in enumerate(GROUPS)}
+
+
+def can_team_go_to_group(team: str, group: str,
+                         conf_counts_by_group: Dict[str, Dict[str, int]],
+                         conf_dict: Dict[str, Tuple[str, ...]]) -> bool:
+    """
+    Check if a team can be assigned to a group based on confederation restrictions.
+
+    Args:
+        team: Team name
+        group: Group letter ('A', 'B', etc.)
+        conf_counts_by_group: Dictionary with a confederation Counter per group
+        conf_dict: Dictionary mapping teams to their confederation(s)
+
+    Returns:
+        bool: True if team can go to the group, False otherwise
+    """
+    # Get team's confederation(s) (several for playoff teams). Every pot team
+    # is guaranteed to be in conf_dict by validate_data()
+    team_confederations = conf_dict[team]
+
+    # Confederations already in the group, kept up to date on assignment
+    conf_counter = conf_counts_by_group[group]
+
+    # Check each confederation of the team, exiting on the first one at its
+    # limit. UEFA can have maximum 2 teams per group, others maximum 1.
+    # dict.get skips Counter.__missing__ for confederations not in the group
+    for conf in team_confederations:
+        limit = MAX_UEFA_PER_GROUP if conf == 'UEFA' else MAX_OTHER_CONF_PER_GROUP
+        if conf_counter.get(conf, 0) >= limit:
+            return False
+
+    return True
+
+
+def get_available_groups_for_team(team: str, pot_name: str,
+                                  conf_counts_by_group: Dict[str, Dict[str, int]],
+                                  groups_filled_by_pot: Dict[str, int],
+                                  conf_dict: Dict[str, Tuple[str, ...]]) -> int:
+    """
+    Get the groups where a team can be assigned, as a bitmask over GROUPS.
+
+    Args:
+        team: Team name
+        pot_name: Pot name ('Pot 1', 'Pot 2', etc.)
+        conf_counts_by_group: Dictionary with a confederation Counter per group
+        groups_filled_by_pot: Dictionary with a bitmask of the filled groups for each pot
+        conf_dict: Dictionary mapping teams to confederations
+
+    Returns:
+        int: Bitmask of available groups (bit i set = GROUPS[i] available)
+    """
+    available_mask = 0
+    filled_mask = groups_filled_by_pot[pot_name]
+
+    for group, bit in GROUP_BITS.items():
+        # Skip if group already has a team from this pot
+        if filled_mask & bit:
+            continue
+
+        # Check confederation restrictions (a direct native call once compiled)
+        if can_team_go_to_group(team, group, conf_counts_by_group, conf_dict):
+            available_mask |= bit
+
+    return available_mask
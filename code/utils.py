@@ -3,98 +3,533 @@ Utility functions
 Helper functions for file I/O and data export
 """
 
+import json
+import logging
 import os
-import pandas as pd
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
+from itertools import islice
+from pathlib import Path
 from .config import *
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.dataset as pa_ds
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Export and summary messages: run_simulator.py logs INFO to stdout, raise the
+# level to WARNING to silence them in batch runs
+logger = logging.getLogger(__name__)
+
 
 def ensure_output_directory():
     """
     Create output directory if it doesn't exist.
     """
-    if not os.path.exists(OUTPUT_DIR):
+    # Attempt the mkdir directly (no separate exists() check, no race) and
+    # only report when the directory was actually created
+    try:
         os.makedirs(OUTPUT_DIR)
-        print(f"✅ Created output directory: {OUTPUT_DIR}")
+    except FileExistsError:
+        return
+    logger.info(f"✅ Created output directory: {OUTPUT_DIR}")
+
+
+def get_output_format():
+    """
+    Get the table format used for exports.
+
+    Returns:
+        str: OUTPUT_FORMAT ('parquet' or 'dataset') if configured and pyarrow
+             is installed, 'csv' otherwise
+
+    Raises:
+        ValueError: If OUTPUT_FORMAT is not 'parquet', 'csv' or 'dataset'
+    """
+    if OUTPUT_FORMAT not in ('parquet', 'csv', 'dataset'):
+        raise ValueError(
+            f"Unknown OUTPUT_FORMAT: {OUTPUT_FORMAT!r} (expected 'parquet', 'csv' or 'dataset')"
+        )
+
+    if OUTPUT_FORMAT != 'csv' and PYARROW_AVAILABLE:
+        return OUTPUT_FORMAT
+    return 'csv'
+
+
+def open_arrow_writer(sink, schema, output_format, run_metadata=None):
+    """
+    Open a pyarrow file writer for Parquet or CSV.
+
+    The CSV writer is Arrow's C++ one, which formats whole columns at once
+    instead of row by row like DataFrame.to_csv. It quotes every string value
+    and writes whole floats without '.0'; the file reads back the same.
+    Parquet files also carry the run metadata as JSON under the 'simulation'
+    key of their key-value metadata.
+
+    Args:
+        sink: pyarrow output stream to write to (left open by the writer)
+        schema: pyarrow Schema of the tables that will be written
+        output_format: 'parquet' or 'csv'
+        run_metadata: Metadata of the run that produced the data
+                      (None = create_simulation_metadata())
+
+    Returns:
+        pq.ParquetWriter or pa_csv.CSVWriter: Open writer, to be closed by the caller
+    """
+    if output_format == 'parquet':
+        metadata = dict(schema.metadata or {})
+        metadata[b'simulation'] = json.dumps(run_metadata or create_simulation_metadata()).encode()
+        return pq.ParquetWriter(sink, schema.with_metadata(metadata),
+                                compression=PARQUET_COMPRESSION)
+
+    return pa_csv.CSVWriter(sink, schema)
+
+
+def write_table(df, file_stem, output_format, row_group_size=None, chunk_size=None,
+                run_metadata=None):
+    """
+    Write a DataFrame as Parquet or CSV, streaming it in chunks of rows.
+
+    Only one chunk is converted to text or Arrow at a time, so peak memory
+    grows with chunk_size rather than with the size of the DataFrame. CSV is
+    written with pyarrow when installed, and with pandas otherwise.
+
+    Args:
+        df: DataFrame to write
+        file_stem: Output path without extension
+        output_format: 'parquet' or 'csv'
+        row_group_size: Rows per Parquet row group (None = pyarrow default)
+        chunk_size: Rows written per chunk (None = whole DataFrame at once)
+        run_metadata: Metadata embedded in Parquet files (see open_arrow_writer)
+
+    Returns:
+        Path: Path of the written file
+    """
+    file_path = Path(file_stem).with_suffix(f".{output_format}")
+
+    # An empty DataFrame still gets one (empty) chunk, so the file has a header/schema
+    num_rows = max(len(df), 1)
+    chunk_size = chunk_size or num_rows
+    chunks = (df.iloc[start:start + chunk_size] for start in range(0, num_rows, chunk_size))
+
+    # Files are opened once, with a WRITE_BUFFER_SIZE buffer, for all chunks
+    if PYARROW_AVAILABLE:
+        # Row groups only exist in Parquet
+        write_options = {'row_group_size': row_group_size} if output_format == 'parquet' else {}
+        with pa.output_stream(str(file_path), buffer_size=WRITE_BUFFER_SIZE) as sink:
+            writer = None
+            try:
+                for chunk in chunks:
+                    table = pa.Table.from_pandas(chunk, preserve_index=False)
+                    if writer is None:
+                        writer = open_arrow_writer(sink, table.schema, output_format,
+                                                   run_metadata)
+                    writer.write_table(table, **write_options)
+            finally:
+                if writer is not None:
+                    writer.close()
+    else:
+        with open(file_path, 'w', buffering=WRITE_BUFFER_SIZE, newline='') as f:
+            for i, chunk in enumerate(chunks):
+                # Only the first chunk writes the header
+                chunk.to_csv(f, header=i == 0, index=False)
+
+    return file_path
+
+
+def write_parquet_dataset(tables, base_dir, run_metadata=None):
+    """
+    Write several DataFrames as one Hive-partitioned Parquet dataset.
+
+    The tables are stacked with the union of their columns (null where a
+    table lacks one) and a 'category' column naming their source, which
+    partitions the output: base_dir/category=<name>/part-0.parquet. Readers
+    such as DuckDB load it with a single query and skip unneeded categories.
+    Rows keep their order within each category.
+
+    Args:
+        tables: Dictionary {category: DataFrame}
+        base_dir: Output directory of the dataset
+        run_metadata: Metadata of the run that produced the data
+                      (None = create_simulation_metadata())
+
+    Returns:
+        Path: Directory of the written dataset, or None if there were no rows
+              to write (the dataset would have no files)
+    """
+    arrow_tables = {
+        category: pa.Table.from_pandas(df, preserve_index=False)
+        for category, df in tables.items()
+    }
+
+    # Union of all columns, in order of first appearance
+    column_types = {}
+    for table in arrow_tables.values():
+        for field in table.schema:
+            column_types.setdefault(field.name, field.type)
+
+    combined = pa.concat_tables([
+        pa.table({
+            **{
+                name: table.column(name) if name in table.column_names
+                else pa.nulls(len(table), column_type)
+                for name, column_type in column_types.items()
+            },
+            'category': pa.array([category] * len(table), type=pa.string())
+        })
+        for category, table in arrow_tables.items()
+    ])
+    if combined.num_rows == 0:
+        return None
+
+    combined = combined.replace_schema_metadata(
+        {b'simulation': json.dumps(run_metadata or create_simulation_metadata()).encode()}
+    )
+
+    file_format = pa_ds.ParquetFileFormat()
+    pa_ds.write_dataset(
+        combined, str(base_dir), format=file_format,
+        file_options=file_format.make_write_options(compression=PARQUET_COMPRESSION),
+        partitioning=['category'], partitioning_flavor='hive',
+        max_rows_per_group=PARQUET_ROW_GROUP_SIZE,
+        existing_data_behavior='overwrite_or_ignore',
+        # A single writer thread keeps rows in input order, so each category
+        # stays sorted by frequency (preserve_order only exists in newer pyarrow)
+        use_threads=False
+    )
+
+    return Path(base_dir)
+
+
+def copy_csv_head(source_path, file_stem, num_rows):
+    """
+    Copy the header and first rows of a CSV file to a new CSV file.
+
+    Lines are copied as raw bytes, without parsing or re-encoding them, so
+    rows must not contain embedded line breaks.
+
+    Args:
+        source_path: Path of the CSV file to copy from
+        file_stem: Output path without extension
+        num_rows: Number of data rows to copy
+
+    Returns:
+        Path: Path of the written file
+    """
+    file_path = Path(file_stem).with_suffix('.csv')
+
+    with open(source_path, 'rb') as source, open(file_path, 'wb') as target:
+        target.writelines(islice(source, num_rows + 1))
+
+    return file_path
+
+
+def write_summary_csv(summary_rows, file_stem):
+    """
+    Write the simulation summary as a two-column CSV file.
+
+    The whole file is formatted in memory and written with a single call, a
+    13-row table needs neither a DataFrame nor csv.writer. Metric names are
+    fixed labels without commas or quotes, so no field needs quoting.
+
+    Args:
+        summary_rows: List of (metric, value) tuples
+        file_stem: Output path without extension
+
+    Returns:
+        Path: Path of the written file
+    """
+    file_path = Path(file_stem).with_suffix('.csv')
+
+    lines = ['Metric,Value\n']
+    lines.extend(f"{metric},{value}\n" for metric, value in summary_rows)
+
+    # Text mode writes os.linesep line endings, like DataFrame.to_csv
+    with open(file_path, 'w') as f:
+        f.write(''.join(lines))
+
+    return file_path
+
+
+def write_results_tables(df_results, results_stem, top_stem, output_format, run_metadata=None):
+    """
+    Write the complete results and the top combinations.
+
+    Results are sorted by frequency, so the top combinations are a prefix of
+    them: for CSV they are copied from the start of the results file instead
+    of being serialized a second time.
+
+    Args:
+        df_results: DataFrame with all combinations, sorted by frequency
+        results_stem: Output path of the complete results, without extension
+        top_stem: Output path of the top combinations, without extension
+        output_format: 'parquet' or 'csv'
+        run_metadata: Metadata embedded in Parquet files (see open_arrow_writer)
+
+    Returns:
+        tuple: (results_file, top_file)
+    """
+    # Row groups let readers skip unneeded data
+    results_file = write_table(df_results, results_stem, output_format,
+                               row_group_size=PARQUET_ROW_GROUP_SIZE,
+                               chunk_size=RESULTS_CHUNK_SIZE, run_metadata=run_metadata)
+
+    if output_format == 'csv':
+        top_file = copy_csv_head(results_file, top_stem, TOP_N_COMBINATIONS)
+    else:
+        top_file = write_table(df_results.head(TOP_N_COMBINATIONS), top_stem, output_format,
+                               run_metadata=run_metadata)
+
+    return results_file, top_file
+
+
+def format_time(moment=None, time_format=DISPLAY_TIME_FORMAT):
+    """
+    Format a point in time for banners or file names.
+
+    Args:
+        moment: datetime to format (None = now)
+        time_format: strftime format, DISPLAY_TIME_FORMAT or FILE_TIMESTAMP_FORMAT
+
+    Returns:
+        str: Formatted time
+    """
+    return (moment or datetime.now()).strftime(time_format)
 
 
-def export_results_to_csv(analysis_report, simulation_results):
+def export_results_to_csv(analysis_report, simulation_results, timestamp=None):
     """
-    Export all analysis results to CSV files.
+    Export all analysis results to Parquet or CSV files, or to a single
+    Parquet dataset (see OUTPUT_FORMAT).
+
+    The summary table mixes value types and is tiny, so it is always CSV.
+    The dataset has no separate top combinations: they are the first rows
+    of its 'resultados_completos' category.
 
     Args:
         analysis_report: Dictionary with analysis results
         simulation_results: Dictionary with simulation results
+        timestamp: Run ID used in every file name (None = current time in
+                   FILE_TIMESTAMP_FORMAT)
     """
     ensure_output_directory()
 
-    print("\n💾 EXPORTING RESULTS TO CSV")
-    print("=" * 70)
+    output_format = get_output_format()
 
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    logger.info(f"\n💾 EXPORTING RESULTS TO {output_format.upper()}")
+    logger.info("=" * 70)
 
-    # 1. Export complete results
-    df_results = analysis_report['df_results']
-    results_file = f"{OUTPUT_DIR}/resultados_completos_{timestamp}.csv"
-    df_results.to_csv(results_file, index=False)
-    print(f"✅ Complete results: {results_file}")
-    print(f"   • Total combinations: {len(df_results):,}")
+    if not PYARROW_AVAILABLE and OUTPUT_FORMAT != 'csv':
+        logger.warning("⚠️ pyarrow not installed, falling back to CSV")
 
-    # 2. Export Top 100 combinations
-    top_100_file = f"{OUTPUT_DIR}/top_100_combinaciones_{timestamp}.csv"
-    df_results.head(TOP_N_COMBINATIONS).to_csv(top_100_file, index=False)
-    print(f"✅ Top 100 combinations: {top_100_file}")
+    if timestamp is None:
+        timestamp = format_time(time_format=FILE_TIMESTAMP_FORMAT)
+    output_dir = Path(OUTPUT_DIR)
 
-    # 3. Export analysis by pot
+    df_results = analysis_report['df_results']
     analysis_by_pot = analysis_report['analysis_by_pot']
 
-    for pot_name, pot_df in analysis_by_pot.items():
-        pot_file = f"{OUTPUT_DIR}/analisis_{pot_name.replace(' ', '_').lower()}_{timestamp}.csv"
-        pot_df.to_csv(pot_file, index=False)
-        print(f"✅ {pot_name} analysis: {pot_file}")
-
-    # 4. Export summary statistics
-    summary_data = {
-        'Metric': [
-            'Total Simulations',
-            'Successful Simulations',
-            'Failed Simulations',
-            'Success Rate (%)',
-            'Unique Combinations',
-            'Total Time (seconds)',
-            'Average Speed (sim/sec)',
-            'Highest Probability (%)',
-            'Top 10 Cumulative Probability (%)',
-            'Top 20 Cumulative Probability (%)',
-            'Top 50 Cumulative Probability (%)',
-            'Top 100 Cumulative Probability (%)',
-            'Gini Index'
-        ],
-        'Value': [
-            NUM_SIMULATIONS,
-            simulation_results['successful'],
-            simulation_results['failed'],
-            round((simulation_results['successful'] / NUM_SIMULATIONS) * 100, 2),
-            len(df_results),
-            round(simulation_results['total_time'], 2),
-            round(NUM_SIMULATIONS / simulation_results['total_time'], 0),
-            analysis_report['concentration_metrics']['prob_top_1'],
-            analysis_report['concentration_metrics']['prob_top_10'],
-            analysis_report['concentration_metrics']['prob_top_20'],
-            analysis_report['concentration_metrics']['prob_top_50'],
-            analysis_report['concentration_metrics']['prob_top_100'],
-            round(analysis_report['concentration_metrics']['gini_index'], 4)
+    # Summary statistics, built up front so that all files can be written together
+    concentration_metrics = analysis_report['concentration_metrics']
+    # Counted from the results, not NUM_SIMULATIONS: a checkpoint may have
+    # been saved by a run with a different number of simulations
+    num_simulations = simulation_results['successful'] + simulation_results['failed']
+    # Likewise, Parquet files describe the run that produced the results.
+    # Resolved here, in the main thread, before the writer threads need it
+    run_metadata = get_run_metadata(simulation_results)
+    summary_rows = [
+        ('Total Simulations', num_simulations),
+        ('Successful Simulations', simulation_results['successful']),
+        ('Failed Simulations', simulation_results['failed']),
+        ('Success Rate (%)', round((simulation_results['successful'] / num_simulations) * 100, 2)),
+        ('Unique Combinations', len(df_results)),
+        ('Total Time (seconds)', round(simulation_results['total_time'], 2)),
+        ('Average Speed (sim/sec)', round(num_simulations / simulation_results['total_time'], 0)),
+        ('Highest Probability (%)', concentration_metrics['prob_top_1']),
+        ('Top 10 Cumulative Probability (%)', concentration_metrics['prob_top_10']),
+        ('Top 20 Cumulative Probability (%)', concentration_metrics['prob_top_20']),
+        ('Top 50 Cumulative Probability (%)', concentration_metrics['prob_top_50']),
+        ('Top 100 Cumulative Probability (%)', concentration_metrics['prob_top_100']),
+        ('Gini Index', round(concentration_metrics['gini_index'], 4))
+    ]
+
+    # Independent exports: (label, write function, arguments)
+    export_tasks = []
+    if output_format == 'dataset':
+        # 1-3. Complete results and analysis by pot, as categories of one dataset
+        dataset_tables = {'resultados_completos': df_results}
+        for pot_name, pot_df in analysis_by_pot.items():
+            dataset_tables[f"analisis_{pot_name.replace(' ', '_').lower()}"] = pot_df
+        export_tasks.append(('Results dataset', write_parquet_dataset,
+                             (dataset_tables, output_dir / f"resultados_{timestamp}",
+                              run_metadata)))
+    else:
+        # 3. Analysis by pot
+        for pot_name, pot_df in analysis_by_pot.items():
+            pot_slug = pot_name.replace(' ', '_').lower()
+            export_tasks.append((
+                f"{pot_name} analysis", partial(write_table, run_metadata=run_metadata),
+                (pot_df, output_dir / f"analisis_{pot_slug}_{timestamp}", output_format)
+            ))
+
+    # 4. Summary statistics
+    export_tasks.append(('Simulation summary', write_summary_csv,
+                         (summary_rows, output_dir / f"simulation_summary_{timestamp}")))
+
+    # Writes are I/O and C code that release the GIL, so threads overlap them.
+    # Messages are printed here, in the main thread, in task order
+    with ThreadPoolExecutor(max_workers=min(EXPORT_THREADS, len(export_tasks) + 1)) as executor:
+        # 1-2. Complete results and Top 100 combinations (one task, the latter
+        # may be copied from the former)
+        results_future = None
+        if output_format != 'dataset':
+            results_future = executor.submit(
+                write_results_tables, df_results,
+                output_dir / f"resultados_completos_{timestamp}",
+                output_dir / f"top_100_combinaciones_{timestamp}", output_format,
+                run_metadata
+            )
+        task_futures = [
+            (label, executor.submit(write_function, *args))
+            for label, write_function, args in export_tasks
         ]
+
+        if results_future is not None:
+            results_file, top_100_file = results_future.result()
+            logger.info(f"✅ Complete results: {results_file}")
+            logger.info(f"   • Total combinations: {len(df_results):,}")
+            logger.info(f"✅ Top 100 combinations: {top_100_file}")
+
+        for label, future in task_futures:
+            file_path = future.result()
+            if file_path is None:
+                logger.warning(f"⚠️ {label}: no rows, nothing written")
+            else:
+                logger.info(f"✅ {label}: {file_path}")
+
+    logger.info(f"\n{'=' * 70}")
+    logger.info(f"✅ All results exported successfully!")
+    logger.info(f"{'=' * 70}\n")
+
+
+def save_simulation_checkpoint(simulation_results, checkpoint_path, target_team=TARGET_TEAM):
+    """
+    Save simulation results to an Arrow IPC file, so the analysis can be rerun
+    without simulating again.
+
+    Combinations are stored as one string column per pot plus a frequency
+    column; the simulation counters and the run metadata (see
+    get_run_metadata()) go in the schema metadata.
+
+    Args:
+        simulation_results: Dictionary returned by run_mass_simulation()
+        checkpoint_path: Path of the checkpoint file
+        target_team: Name of target team the combinations belong to
+
+    Returns:
+        bool: True if the checkpoint was written, False if pyarrow is missing
+    """
+    if not PYARROW_AVAILABLE:
+        logger.warning("⚠️ pyarrow not installed, checkpoint not saved")
+        return False
+
+    combinations_counter = simulation_results['combinations']
+    pot_columns = list(zip(*combinations_counter)) or [(), (), ()]
+
+    table = pa.table(
+        {
+            'Pot 2': pa.array(pot_columns[0], type=pa.string()),
+            'Pot 3': pa.array(pot_columns[1], type=pa.string()),
+            'Pot 4': pa.array(pot_columns[2], type=pa.string()),
+            'Frequency': pa.array(combinations_counter.values(), type=pa.int64())
+        },
+        metadata={
+            'target_team': target_team,
+            'successful': str(simulation_results['successful']),
+            'failed': str(simulation_results['failed']),
+            'total_time': repr(simulation_results['total_time']),
+            'simulation': json.dumps(get_run_metadata(simulation_results))
+        }
+    )
+
+    # The checkpoint is written before the exports create OUTPUT_DIR
+    Path(checkpoint_path).parent.mkdir(parents=True, exist_ok=True)
+    with pa.ipc.new_file(str(checkpoint_path), table.schema) as writer:
+        writer.write_table(table)
+
+    logger.info(f"💾 Checkpoint saved: {checkpoint_path} ({len(combinations_counter):,} combinations)")
+    return True
+
+
+def load_simulation_checkpoint(checkpoint_path, target_team=TARGET_TEAM):
+    """
+    Load simulation results saved by save_simulation_checkpoint().
+
+    The file is memory-mapped, so the Arrow columns are read without copying.
+
+    Args:
+        checkpoint_path: Path of the checkpoint file
+        target_team: Name of target team, must match the checkpoint
+
+    Returns:
+        dict: Same structure as run_mass_simulation(), plus the 'metadata' of
+              the run that saved it, or None if there is no checkpoint to load
+              (missing file or pyarrow not installed)
+
+    Raises:
+        ValueError: If the file is not a simulation checkpoint, or is for
+                    another target team
+    """
+    if not os.path.exists(checkpoint_path):
+        return None
+
+    if not PYARROW_AVAILABLE:
+        logger.warning("⚠️ pyarrow not installed, ignoring checkpoint")
+        return None
+
+    try:
+        with pa.memory_map(str(checkpoint_path)) as source:
+            table = pa.ipc.open_file(source).read_all()
+    except pa.ArrowInvalid:
+        raise ValueError(f"{checkpoint_path} is not a simulation checkpoint") from None
+
+    # Files not written by save_simulation_checkpoint() lack its metadata or columns
+    checkpoint_keys = {'target_team', 'successful', 'failed', 'total_time'}
+    checkpoint_columns = {'Pot 2', 'Pot 3', 'Pot 4', 'Frequency'}
+    metadata = {
+        key.decode(): value.decode()
+        for key, value in (table.schema.metadata or {}).items()
     }
+    if not (checkpoint_keys <= metadata.keys() and checkpoint_columns <= set(table.column_names)):
+        raise ValueError(f"{checkpoint_path} is not a simulation checkpoint")
 
-    df_summary = pd.DataFrame(summary_data)
-    summary_file = f"{OUTPUT_DIR}/simulation_summary_{timestamp}.csv"
-    df_summary.to_csv(summary_file, index=False)
-    print(f"✅ Simulation summary: {summary_file}")
+    if metadata['target_team'] != target_team:
+        raise ValueError(
+            f"Checkpoint {checkpoint_path} is for {metadata['target_team']}, not {target_team}"
+        )
 
-    print(f"\n{'=' * 70}")
-    print(f"✅ All results exported successfully!")
-    print(f"{'=' * 70}\n")
+    combinations = zip(*(table.column(pot).to_pylist() for pot in ['Pot 2', 'Pot 3', 'Pot 4']))
+    combinations_counter = Counter(dict(zip(combinations, table.column('Frequency').to_pylist())))
+
+    logger.info(f"📂 Checkpoint loaded: {checkpoint_path} ({len(combinations_counter):,} combinations)")
+
+    simulation_results = {
+        'combinations': combinations_counter,
+        'successful': int(metadata['successful']),
+        'failed': int(metadata['failed']),
+        'total_time': float(metadata['total_time'])
+    }
+    # Metadata of the run that produced the checkpoint, for the exports
+    if 'simulation' in metadata:
+        simulation_results['metadata'] = json.loads(metadata['simulation'])
+
+    return simulation_results
 
 
 def print_quick_summary(analysis_report, target_team=TARGET_TEAM):
@@ -106,33 +541,46 @@ def print_quick_summary(analysis_report, target_team=TARGET_TEAM):
         target_team: Name of target team
     """
     df_results = analysis_report['df_results']
-    analysis_by_pot = analysis_report['analysis_by_pot']
+    top_per_pot = analysis_report['top_per_pot']
 
-    print("\n" + "=" * 70)
-    print(f"🎯 QUICK SUMMARY - {target_team.upper()}'S GROUP")
-    print("=" * 70)
+    logger.info("\n" + "=" * 70)
+    logger.info(f"🎯 QUICK SUMMARY - {target_team.upper()}'S GROUP")
+    logger.info("=" * 70)
 
-    print("\n📊 Most Likely Opponents:")
+    logger.info("\n📊 Most Likely Opponents:")
 
     for pot_name in ['Pot 2', 'Pot 3', 'Pot 4']:
-        top_team = analysis_by_pot[pot_name].iloc[0]
-        print(f"   • {pot_name}: {top_team['Team']} ({top_team['Probability (%)']:.2f}%)")
+        team, probability = top_per_pot[pot_name]
+        # No team when there were no successful simulations
+        if team is None:
+            continue
+        logger.info(f"   • {pot_name}: {team} ({probability:.2f}%)")
+
+    logger.info("\n🏆 Most Likely Complete Group:")
+    if df_results.empty:
+        logger.info("   No successful simulations")
+        logger.info("\n" + "=" * 70 + "\n")
+        return
 
-    print("\n🏆 Most Likely Complete Group:")
     top_group = df_results.iloc[0]
-    print(f"   1. {top_group['Pot 1']}")
-    print(f"   2. {top_group['Pot 2']}")
-    print(f"   3. {top_group['Pot 3']}")
-    print(f"   4. {top_group['Pot 4']}")
-    print(f"   Probability: {top_group['Probability (%)']:.4f}%")
+    logger.info(f"   1. {top_group['Pot 1']}")
+    logger.info(f"   2. {top_group['Pot 2']}")
+    logger.info(f"   3. {top_group['Pot 3']}")
+    logger.info(f"   4. {top_group['Pot 4']}")
+    logger.info(f"   Probability: {top_group['Probability (%)']:.4f}%")
 
-    print("\n" + "=" * 70 + "\n")
+    logger.info("\n" + "=" * 70 + "\n")
 
 
+@lru_cache(maxsize=1)
 def create_simulation_metadata():
     """
     Create metadata about the simulation run.
 
+    Cached per process: the first call captures the run timestamp and every
+    later call (exports, checkpoints, logging) returns the same dictionary,
+    which must therefore be treated as read-only.
+
     Returns:
         dict: Metadata dictionary
     """
@@ -145,4 +593,26 @@ def create_simulation_metadata():
         'teams_per_group': TEAMS_PER_GROUP,
         'max_uefa_per_group': MAX_UEFA_PER_GROUP,
         'max_other_conf_per_group': MAX_OTHER_CONF_PER_GROUP
-    }
\ No newline at end of file
+    }
+
+
+def get_run_metadata(simulation_results):
+    """
+    Get the metadata of the run that produced simulation results.
+
+    Results loaded from a checkpoint carry the metadata saved with it.
+    Otherwise they come from this run, described by create_simulation_metadata()
+    with the number of simulations counted from the results.
+
+    Args:
+        simulation_results: Dictionary returned by run_mass_simulation() or
+                            load_simulation_checkpoint()
+
+    Returns:
+        dict: Metadata dictionary (read-only)
+    """
+    if 'metadata' in simulation_results:
+        return simulation_results['metadata']
+
+    num_simulations = simulation_results['successful'] + simulation_results['failed']
+    return {**create_simulation_metadata(), 'num_simulations': num_simulations}
@@ -5,39 +5,52 @@ This script orchestrates the entire simulation process:
 1. Load and validate data
 2. Run mass simulation
 3. Analyze results
-4. Export to CSV files
+4. Export to Parquet/CSV files
 
 Usage:
     python run_simulation.py
+
+Set the CHECKPOINT_PATH environment variable to save the simulation results
+to that file (Arrow IPC, requires pyarrow), or to load them from it when it
+already exists and skip straight to the analysis.
 """
 
+import os
 import sys
-import random
+import logging
 import numpy as np
 from datetime import datetime
 
 # Import modules from code package
-from code.config import RANDOM_SEED
+from code.config import RANDOM_SEED, FILE_TIMESTAMP_FORMAT
 from code.data_loader import load_and_validate_all
 from code.simulator import run_mass_simulation
 from code.analyzer import generate_analysis_report
-from code.utils import export_results_to_csv, print_quick_summary
+from code.utils import (export_results_to_csv, print_quick_summary, format_time,
+                        save_simulation_checkpoint, load_simulation_checkpoint,
+                        create_simulation_metadata)
 
 
 def main():
     """
     Main execution function
     """
+    # Messages from code.utils go through logging; same stream as the prints
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+
     print("=" * 70)
     print("⚽ FIFA WORLD CUP 2026 - DRAW SIMULATOR")
     print("=" * 70)
-    print(f"Execution start: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    # Start time, also the run ID shared by every exported file
+    run_start = datetime.now()
+    print(f"Execution start: {format_time(run_start)}")
+    create_simulation_metadata()  # Cached, so its timestamp is the run start
     print("=" * 70)
 
-    # Set random seed for reproducibility
+    # Random generator for the run, seeded for reproducibility (a None seed
+    # draws fresh entropy from the OS). No global random state is touched
+    rng = np.random.default_rng(RANDOM_SEED)
     if RANDOM_SEED is not None:
-        random.seed(RANDOM_SEED)
-        np.random.seed(RANDOM_SEED)
         print(f"\n🎲 Random seed set to: {RANDOM_SEED} (for reproducibility)")
     else:
         print(f"\n🎲 Random seed: None (true randomness)")
@@ -50,7 +63,7 @@ def main():
         print("STEP 1: LOADING DATA")
         print("=" * 70)
 
-        df_pots, df_confederations, conf_dict, pot_dict = load_and_validate_all()
+        draw_data = load_and_validate_all()
 
         # ============================================
         # STEP 2: Run mass simulation
@@ -59,12 +72,20 @@ def main():
         print("STEP 2: RUNNING SIMULATION")
         print("=" * 70)
 
-        simulation_results = run_mass_simulation(
-            df_pots=df_pots,
-            conf_dict=conf_dict,
-            pot_dict=pot_dict,
-            show_progress=True
-        )
+        # Resume from a checkpoint when there is one, otherwise simulate (and
+        # save a checkpoint if a path was given)
+        checkpoint_path = os.environ.get('CHECKPOINT_PATH')
+        simulation_results = load_simulation_checkpoint(checkpoint_path) if checkpoint_path else None
+
+        if simulation_results is None:
+            simulation_results = run_mass_simulation(
+                draw_data=draw_data,
+                show_progress=True,
+                rng=rng
+            )
+
+            if checkpoint_path:
+                save_simulation_checkpoint(simulation_results, checkpoint_path)
 
         # ============================================
         # STEP 3: Analyze results
@@ -75,7 +96,7 @@ def main():
 
         analysis_report = generate_analysis_report(
             simulation_results=simulation_results,
-            df_pots=df_pots
+            df_pots=draw_data.df_pots
         )
 
         # ============================================
@@ -85,7 +106,8 @@ def main():
         print("STEP 4: EXPORTING RESULTS")
         print("=" * 70)
 
-        export_results_to_csv(analysis_report, simulation_results)
+        export_results_to_csv(analysis_report, simulation_results,
+                              timestamp=format_time(run_start, FILE_TIMESTAMP_FORMAT))
 
         # ============================================
         # STEP 5: Print quick summary
@@ -98,7 +120,7 @@ def main():
         print("=" * 70)
         print("✅ SIMULATION COMPLETED SUCCESSFULLY!")
         print("=" * 70)
-        print(f"Execution end: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"Execution end: {format_time()}")
         print("\n📂 Check the 'output/' folder for detailed results")
         print("=" * 70)
 